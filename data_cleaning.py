@@ -5,12 +5,15 @@ import pandas as pd
 import numpy as np
 
 ECCC_KEEP_MAP = {
+    "Climate ID": "station_id",
     "Max Temp (°C)": "tmax_c",
     "Min Temp (°C)": "tmin_c",
     "Mean Temp (°C)": "tmean_c",
     "Total Precip (mm)": "precip_mm",
     "Total Snow (cm)": "snow_cm",
     "Spd of Max Gust (km/h)": "gust_kmh",
+    "Heat Deg Days (°C)": "hdd_c",
+    "Cool Deg Days (°C)": "cdd_c",
 }
 
 def load_raw_csvs(input_dir: str):
@@ -38,7 +41,7 @@ def clean_daily_dataframe(raw: pd.DataFrame):
     keep_cols = ["date"] + [c for c in ECCC_KEEP_MAP.keys() if c in df.columns]
     df = df[keep_cols].rename(columns=ECCC_KEEP_MAP)
     # coerce to numeric
-    for c in ["tmax_c","tmin_c","tmean_c","precip_mm","snow_cm","gust_kmh"]:
+    for c in ["tmax_c","tmin_c","tmean_c","precip_mm","snow_cm","gust_kmh","hdd_c","cdd_c"]:
         if c in df.columns:
             df[c] = pd.to_numeric(df[c], errors="coerce")
     # derive range and wet day flag
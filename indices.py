@@ -0,0 +1,72 @@
+
+import numpy as np
+import pandas as pd
+
+def group_keys(clean: pd.DataFrame):
+    """Monthly grouping keys present in the frame (station first when available)."""
+    return [c for c in ["station_id","year","month"] if c in clean.columns]
+
+def max_run_lengths(flag, group, day=None, n_groups=None):
+    """Longest run of True in `flag` per group code, via run-length encoding.
+
+    `group` must hold contiguous integer codes (rows sorted by group). If `day`
+    (integer day numbers) is given, a gap of more than one day also ends a run.
+    """
+    flag = np.asarray(flag, dtype=bool)
+    group = np.asarray(group, dtype=np.int64)
+    if n_groups is None:
+        n_groups = int(group.max()) + 1 if len(group) else 0
+    out = np.zeros(n_groups, dtype=np.int64)
+    n = len(flag)
+    if n == 0:
+        return out
+    # a new run starts wherever the flag, the group, or the day sequence breaks
+    brk = np.ones(n, dtype=bool)
+    brk[1:] = (flag[1:] != flag[:-1]) | (group[1:] != group[:-1])
+    if day is not None:
+        brk[1:] |= np.diff(np.asarray(day, dtype=np.int64)) != 1
+    starts = np.flatnonzero(brk)
+    lengths = np.diff(np.append(starts, n))
+    hit = flag[starts]
+    np.maximum.at(out, group[starts[hit]], lengths[hit])
+    return out
+
+def compute_climate_indices(clean: pd.DataFrame, base_temp_c=18.0):
+    """Monthly ETCCDI-style indices: wet/dry spells, frost/ice/freeze-thaw days, heating/cooling degree days."""
+    keys = group_keys(clean)
+    df = clean.dropna(subset=["date"]).sort_values(keys + ["date"], kind="mergesort")
+    nan = pd.Series(np.nan, index=df.index)
+    tmax = df.get("tmax_c", nan)
+    tmin = df.get("tmin_c", nan)
+    tmean = df.get("tmean_c", nan)
+    # prefer ECCC's own degree days, fall back to the mean temperature
+    hdd = df["hdd_c"] if "hdd_c" in df.columns else (base_temp_c - tmean).clip(lower=0)
+    cdd = df["cdd_c"] if "cdd_c" in df.columns else (tmean - base_temp_c).clip(lower=0)
+    wet = df.get("is_wet_day", pd.Series(0, index=df.index)) == 1
+    if "precip_mm" in df.columns:
+        dry = df["precip_mm"] == 0
+    else:
+        dry = ~wet
+
+    daily = df[keys].assign(
+        frost=(tmin < 0).astype(int),
+        ice=(tmax < 0).astype(int),
+        freeze_thaw=((tmax > 0) & (tmin < 0)).astype(int),
+        hdd=hdd,
+        cdd=cdd,
+    )
+    grouped = daily.groupby(keys, sort=True)
+    out = grouped.agg(
+        frost_days=("frost","sum"),
+        ice_days=("ice","sum"),
+        freeze_thaw_days=("freeze_thaw","sum"),
+        heating_degree_days=("hdd","sum"),
+        cooling_degree_days=("cdd","sum"),
+    ).reset_index()
+
+    # ngroup follows the same sorted key order as the aggregate rows
+    group = grouped.ngroup().to_numpy()
+    day = df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    out["max_wet_spell"] = max_run_lengths(wet.to_numpy(), group, day, len(out))
+    out["max_dry_spell"] = max_run_lengths(dry.to_numpy(), group, day, len(out))
+    return out
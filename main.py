@@ -5,6 +5,7 @@ import pandas as pd
 
 from data_cleaning import load_raw_csvs, clean_daily_dataframe, save_clean
 from metrics import compute_baseline_anomaly, compute_storm_index, compute_monthly_summary, compute_annual_means
+from indices import compute_climate_indices
 from style import apply as apply_style
 from plotting import (
     plot_daily_tmean, plot_monthly_mean_with_trend, plot_hist_tmean,
@@ -31,7 +32,8 @@ def run_project_pipeline(input_dir: str, output_dir: str):
     # metrics
     clean = compute_baseline_anomaly(clean, baseline_years=(2020, 2021))
     clean = compute_storm_index(clean)
-    monthly = compute_monthly_summary(clean)
+    indices = compute_climate_indices(clean)
+    monthly = compute_monthly_summary(clean, indices=indices)
     annual = compute_annual_means(clean)
 
     # Save cleaned data & aggregates
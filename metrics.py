@@ -2,6 +2,8 @@
 import numpy as np
 import pandas as pd
 
+from indices import group_keys
+
 def compute_baseline_anomaly(clean: pd.DataFrame, baseline_years=(2020, 2021)):
     """Add tmean anomaly relative to a day-of-year climatology over baseline_years."""
     df = clean.copy()
@@ -27,9 +29,13 @@ def compute_storm_index(clean: pd.DataFrame, w_gust=0.6, w_precip=0.4):
     df["storm_index"] = w_gust*minmax(gust) + w_precip*minmax(precip)
     return df
 
-def compute_monthly_summary(clean: pd.DataFrame):
-    """Monthly aggregates, mean temp, total precip, wet days, max gust, mean temp range, precip intensity."""
-    monthly = clean.groupby(["year","month"]).agg(
+def compute_monthly_summary(clean: pd.DataFrame, indices: pd.DataFrame = None):
+    """Monthly aggregates, mean temp, total precip, wet days, max gust, mean temp range, precip intensity.
+
+    If `indices` (from compute_climate_indices) is given, its columns are joined on the month keys.
+    """
+    keys = group_keys(clean)
+    monthly = clean.groupby(keys).agg(
         mean_temp=("tmean_c","mean"),
         total_precip=("precip_mm","sum"),
         wet_days=("is_wet_day","sum"),
@@ -37,6 +43,8 @@ def compute_monthly_summary(clean: pd.DataFrame):
         temp_range_mean=("temp_range_c","mean"),
     ).reset_index()
     monthly["precip_intensity_mm_per_wetday"] = monthly["total_precip"] / monthly["wet_days"].replace({0:np.nan})
+    if indices is not None:
+        monthly = monthly.merge(indices, on=keys, how="left")
     return monthly
 
 def compute_annual_means(clean: pd.DataFrame):
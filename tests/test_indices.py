@@ -0,0 +1,103 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from indices import max_run_lengths, compute_climate_indices
+from metrics import compute_monthly_summary
+
+
+def _make_clean_df(precip, tmax, tmin, start="2020-01-01"):
+    """Small helper to build a cleaned-style daily frame."""
+    dates = pd.date_range(start, periods=len(precip), freq="D")
+    df = pd.DataFrame(
+        {
+            "date": dates,
+            "tmax_c": tmax,
+            "tmin_c": tmin,
+            "tmean_c": (np.asarray(tmax) + np.asarray(tmin)) / 2.0,
+            "precip_mm": precip,
+        }
+    )
+    df["is_wet_day"] = (df["precip_mm"] > 0).astype(int)
+    df["temp_range_c"] = df["tmax_c"] - df["tmin_c"]
+    df["gust_kmh"] = 30.0
+    df["year"] = df["date"].dt.year
+    df["month"] = df["date"].dt.month
+    return df
+
+
+@pytest.mark.parametrize(
+    "flag, group, expected",
+    [
+        ([1, 1, 0, 1, 1, 1], [0, 0, 0, 0, 0, 0], [3]),
+        ([1, 1, 1, 1], [0, 0, 1, 1], [2, 2]),
+        ([0, 0, 0], [0, 0, 0], [0]),
+    ],
+)
+def test_max_run_lengths_per_group(flag, group, expected):
+    out = max_run_lengths(flag, group)
+    assert out.tolist() == expected
+
+
+def test_max_run_lengths_breaks_on_missing_days():
+    # day 3 is missing, so the wet run is split in two
+    out = max_run_lengths([1, 1, 1, 1], [0, 0, 0, 0], day=[1, 2, 4, 5])
+    assert out.tolist() == [2]
+
+
+def test_indices_spells_and_threshold_counts():
+    df = _make_clean_df(
+        precip=[1.0, 2.0, 0.0, 0.0, 0.0, 3.0],
+        tmax=[-1.0, 2.0, 3.0, -2.0, 5.0, 20.0],
+        tmin=[-5.0, -1.0, 1.0, -6.0, -3.0, 10.0],
+    )
+    out = compute_climate_indices(df)
+
+    assert len(out) == 1
+    row = out.iloc[0]
+    assert row["max_wet_spell"] == 2
+    assert row["max_dry_spell"] == 3
+    assert row["frost_days"] == 4
+    assert row["ice_days"] == 2
+    assert row["freeze_thaw_days"] == 2
+
+
+def test_indices_degree_days_fallback_and_eccc_columns():
+    df = _make_clean_df(precip=[0.0, 0.0], tmax=[10.0, 30.0], tmin=[0.0, 20.0])
+    # tmean is 5 and 25 -> HDD 13 + 0, CDD 0 + 7 with an 18 °C base
+    out = compute_climate_indices(df)
+    assert out["heating_degree_days"].iloc[0] == pytest.approx(13.0)
+    assert out["cooling_degree_days"].iloc[0] == pytest.approx(7.0)
+
+    df["hdd_c"] = [1.5, 2.5]
+    df["cdd_c"] = [0.0, 1.0]
+    out = compute_climate_indices(df)
+    assert out["heating_degree_days"].iloc[0] == pytest.approx(4.0)
+    assert out["cooling_degree_days"].iloc[0] == pytest.approx(1.0)
+
+
+def test_indices_spells_split_by_station_and_month():
+    a = _make_clean_df(precip=[1.0] * 4, tmax=[1.0] * 4, tmin=[0.0] * 4, start="2020-01-30")
+    b = a.copy()
+    a["station_id"] = 1
+    b["station_id"] = 2
+    b.loc[b.index[1], "precip_mm"] = 0.0
+    b["is_wet_day"] = (b["precip_mm"] > 0).astype(int)
+    out = compute_climate_indices(pd.concat([b, a], ignore_index=True))
+
+    assert list(out.columns[:3]) == ["station_id", "year", "month"]
+    assert out["max_wet_spell"].tolist() == [2, 2, 1, 2]
+
+
+def test_monthly_summary_joins_indices():
+    df = _make_clean_df(
+        precip=[1.0, 0.0, 2.0],
+        tmax=[1.0, -1.0, 2.0],
+        tmin=[-1.0, -2.0, 0.5],
+    )
+    monthly = compute_monthly_summary(df, indices=compute_climate_indices(df))
+
+    assert len(monthly) == 1
+    for col in ["wet_days", "max_wet_spell", "max_dry_spell", "frost_days", "heating_degree_days"]:
+        assert col in monthly.columns
+    assert monthly["frost_days"].iloc[0] == 2